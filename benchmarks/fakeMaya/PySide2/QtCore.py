@@ -0,0 +1,52 @@
+class _StubMeta(type):
+
+    def __getattr__(cls, name):
+        # Enum values such as Qt.Horizontal or QSizePolicy.Maximum
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return Stub()
+
+
+# Any attribute or call on a Stub returns another Stub, so unknown Qt methods are no-ops
+Stub = _StubMeta('Stub', (object,), {
+    '__init__': lambda self, *args, **kwargs: None,
+    '__getattr__': lambda self, name: Stub() if not name.startswith('__') else object.__getattribute__(self, name),
+    '__call__': lambda self, *args, **kwargs: Stub(),
+    '__getitem__': lambda self, key: Stub(),
+})
+
+
+class BoundSignal(object):
+
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def disconnect(self, slot=None):
+        self.slots = [s for s in self.slots if slot is not None and s != slot]
+
+    def emit(self, *args):
+        for slot in list(self.slots):
+            slot(*args)
+
+
+class Signal(object):
+
+    def __init__(self, *types):
+        self.types = types
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        signals = instance.__dict__.setdefault('_signals', {})
+        return signals.setdefault(id(self), BoundSignal())
+
+
+class Qt(Stub):
+    pass
+
+
+class QSize(Stub):
+    pass
@@ -0,0 +1,5 @@
+from PySide2.QtCore import Stub
+
+
+class QIcon(Stub):
+    pass
@@ -0,0 +1,227 @@
+from PySide2.QtCore import Stub
+
+
+class QWidget(Stub):
+
+    def __init__(self, parent=None, *args, **kwargs):
+        self._parent = None
+        self._children = []
+        self._layout = None
+        self._visible = False
+        if parent is not None:
+            self.setParent(parent)
+
+    def setParent(self, parent):
+        if self._parent is not None:
+            self._parent._children.remove(self)
+        self._parent = parent
+        if parent is not None:
+            parent._children.append(self)
+
+    def parent(self):
+        return self._parent
+
+    def children(self):
+        return list(self._children)
+
+    def findChildren(self, cls):
+        found = []
+        for child in self._children:
+            if isinstance(child, cls):
+                found.append(child)
+            found.extend(child.findChildren(cls))
+        return found
+
+    def layout(self):
+        return self._layout
+
+    def setLayout(self, layout):
+        layout._setWidget(self)
+
+    def setVisible(self, visible):
+        self._visible = visible
+
+    def isVisible(self):
+        return self._visible
+
+    def show(self):
+        self._visible = True
+
+    def hide(self):
+        self._visible = False
+
+    def close(self):
+        self._visible = False
+
+    def deleteLater(self):
+        self.setParent(None)
+
+
+class QDialog(QWidget):
+    pass
+
+
+class QMainWindow(QWidget):
+    pass
+
+
+class QScrollArea(QWidget):
+
+    def setWidget(self, widget):
+        widget.setParent(self)
+
+
+class _TextWidget(QWidget):
+
+    def __init__(self, text='', parent=None):
+        super(_TextWidget, self).__init__(parent)
+        self._text = text
+
+    def text(self):
+        return self._text
+
+    def setText(self, text):
+        self._text = text
+
+
+class QLabel(_TextWidget):
+    pass
+
+
+class QLineEdit(_TextWidget):
+    pass
+
+
+class QPushButton(_TextWidget):
+    pass
+
+
+class QCheckBox(_TextWidget):
+
+    def __init__(self, text='', parent=None):
+        super(QCheckBox, self).__init__(text, parent)
+        self._checked = False
+
+    def setChecked(self, checked):
+        self._checked = bool(checked)
+
+    def isChecked(self):
+        return self._checked
+
+
+class QSlider(QWidget):
+
+    def __init__(self, orientation=None, parent=None):
+        super(QSlider, self).__init__(parent)
+        self._value = 0
+
+    def setValue(self, value):
+        self._value = value
+
+    def value(self):
+        return self._value
+
+
+class QComboBox(QWidget):
+
+    def __init__(self, parent=None):
+        super(QComboBox, self).__init__(parent)
+        self._items = []
+
+    def addItem(self, item):
+        self._items.append(item)
+
+    def currentText(self):
+        return self._items[0] if self._items else ''
+
+
+class QListWidgetItem(_TextWidget):
+    pass
+
+
+class QListWidget(QWidget):
+
+    def __init__(self, parent=None):
+        super(QListWidget, self).__init__(parent)
+        self._items = []
+
+    def addItem(self, item):
+        self._items.append(item)
+
+    def clear(self):
+        del self._items[:]
+
+    def count(self):
+        return len(self._items)
+
+    def currentItem(self):
+        return None
+
+
+class QLayoutItem(object):
+
+    def __init__(self, widget=None):
+        self._widget = widget
+
+    def widget(self):
+        return self._widget
+
+
+class QLayout(Stub):
+
+    def __init__(self, parent=None):
+        self._widget = None
+        self._items = []
+        if parent is not None:
+            self._setWidget(parent)
+
+    def _setWidget(self, widget):
+        self._widget = widget
+        widget._layout = self
+        for item in self._items:
+            if item.widget() is not None:
+                item.widget().setParent(widget)
+
+    def addWidget(self, widget, *args, **kwargs):
+        if self._widget is not None:
+            widget.setParent(self._widget)
+        self._items.append(QLayoutItem(widget))
+
+    def addItem(self, item):
+        self._items.append(QLayoutItem())
+
+    def count(self):
+        return len(self._items)
+
+    def itemAt(self, index):
+        return self._items[index] if index < len(self._items) else None
+
+    def takeAt(self, index):
+        return self._items.pop(index)
+
+
+class QVBoxLayout(QLayout):
+    pass
+
+
+class QHBoxLayout(QLayout):
+    pass
+
+
+class QGridLayout(QLayout):
+    pass
+
+
+class QSpacerItem(Stub):
+    pass
+
+
+class QSizePolicy(Stub):
+    pass
+
+
+class QFileDialog(Stub):
+
+    @staticmethod
+    def getOpenFileName(parent=None, caption='', directory='', *args, **kwargs):
+        return '', ''
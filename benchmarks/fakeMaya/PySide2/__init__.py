@@ -0,0 +1 @@
+"""Minimal stand-in for PySide2, widgets keep their parent/child tree and layouts, everything else is a no-op"""
@@ -0,0 +1,558 @@
+"""
+In-memory stand-in for the parts of maya.cmds the tools use.
+
+Nodes, attributes, keyframes, selection and scene files are modelled well enough to run the
+tools' logic outside Maya. UI commands only track names. Every command call is counted in
+callCounts so benchmarks can report how many Maya commands an operation would issue.
+"""
+import os
+import re
+import json
+import shutil
+import fnmatch
+import logging
+import tempfile
+import functools
+import collections
+
+logger = logging.getLogger('FakeMaya')
+
+callCounts = collections.Counter()
+
+LIGHT_TYPES = ('pointLight', 'spotLight', 'directionalLight', 'areaLight', 'volumeLight')
+
+COMPOUNDS = {
+    'translate': ('translateX', 'translateY', 'translateZ'),
+    'rotate': ('rotateX', 'rotateY', 'rotateZ'),
+    'scale': ('scaleX', 'scaleY', 'scaleZ'),
+    'color': ('colorR', 'colorG', 'colorB'),
+}
+
+# Default attributes and which of them are keyable, per node type
+TRANSFORM_ATTRS = collections.OrderedDict([
+    ('visibility', True),
+    ('translateX', 0.0), ('translateY', 0.0), ('translateZ', 0.0),
+    ('rotateX', 0.0), ('rotateY', 0.0), ('rotateZ', 0.0),
+    ('scaleX', 1.0), ('scaleY', 1.0), ('scaleZ', 1.0),
+])
+
+LIGHT_ATTRS = collections.OrderedDict([
+    ('visibility', True),
+    ('intensity', 1.0),
+    ('colorR', 1.0), ('colorG', 1.0), ('colorB', 1.0),
+])
+
+NODE_ATTRS = {
+    'transform': TRANSFORM_ATTRS,
+    'renderGlobals': collections.OrderedDict([('imageFormat', 7)]),
+}
+for _lightType in LIGHT_TYPES:
+    NODE_ATTRS[_lightType] = LIGHT_ATTRS
+
+
+class Node(object):
+    __slots__ = ('name', 'type', 'parent', 'children', 'attrs', 'keyable', 'keys')
+
+    def __init__(self, name, nodeType, parent=None):
+        self.name = name
+        self.type = nodeType
+        self.parent = parent
+        self.children = []
+        defaults = NODE_ATTRS.get(nodeType, {})
+        self.attrs = dict(defaults)
+        self.keyable = list(defaults) if nodeType in ('transform',) + LIGHT_TYPES else []
+        # attr -> {time: value}
+        self.keys = {}
+
+        if parent:
+            parent.children.append(self)
+
+    def descendants(self):
+        for child in self.children:
+            yield child
+            for node in child.descendants():
+                yield node
+
+
+class Scene(object):
+
+    def __init__(self):
+        self.nodes = collections.OrderedDict()
+        self.nameCounters = {}
+        self.selection = []
+        self.currentTime = 1.0
+        self.sceneName = ''
+        self.ui = set()
+        self.addNode('defaultRenderGlobals', 'renderGlobals')
+
+    def uniqueName(self, name):
+        if name not in self.nodes:
+            return name
+
+        base = re.sub(r'\d+$', '', name)
+        index = self.nameCounters.get(base, 0)
+        while True:
+            index += 1
+            candidate = '%s%s' % (base, index)
+            if candidate not in self.nodes:
+                self.nameCounters[base] = index
+                return candidate
+
+    def addNode(self, name, nodeType, parent=None):
+        name = self.uniqueName(name)
+        node = Node(name, nodeType, parent)
+        self.nodes[name] = node
+        return node
+
+    def node(self, name):
+        try:
+            return self.nodes[name]
+        except KeyError:
+            raise ValueError('No object matches name: %s' % name)
+
+    def plug(self, plug):
+        name, _, attr = plug.partition('.')
+        node = self.node(name)
+        if attr not in node.attrs and attr not in COMPOUNDS:
+            raise ValueError('No object matches name: %s' % plug)
+        return node, attr
+
+
+scene = Scene()
+
+_userAppDir = []
+
+
+def resetScene():
+    """Start a new empty scene, keeping call counts"""
+    global scene
+    scene = Scene()
+    return scene
+
+
+def resetCallCounts():
+    callCounts.clear()
+
+
+def setUserAppDir(directory):
+    del _userAppDir[:]
+    _userAppDir.append(directory)
+
+
+def cleanUserAppDir():
+    if _userAppDir:
+        shutil.rmtree(_userAppDir.pop(), ignore_errors=True)
+
+
+def _command(func):
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        callCounts[name] += 1
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _flag(kwargs, *names):
+    for name in names:
+        if name in kwargs:
+            return kwargs[name]
+    return None
+
+
+def _evaluate(node, attr, time):
+    keys = node.keys.get(attr)
+    if not keys or time is None:
+        return node.attrs[attr]
+
+    times = sorted(keys)
+    if time <= times[0]:
+        return keys[times[0]]
+    if time >= times[-1]:
+        return keys[times[-1]]
+
+    for previous, later in zip(times, times[1:]):
+        if previous <= time <= later:
+            weight = (time - previous) / float(later - previous)
+            return keys[previous] + (keys[later] - keys[previous]) * weight
+
+
+# Nodes and attributes
+
+
+@_command
+def createNode(nodeType, name=None, parent=None, **kwargs):
+    parentNode = scene.node(parent) if parent else None
+    return scene.addNode(name or '%s1' % nodeType, nodeType, parentNode).name
+
+
+@_command
+def ls(*args, **kwargs):
+    nodes = scene.nodes.values()
+
+    if _flag(kwargs, 'selection', 'sl'):
+        nodes = [scene.nodes[name] for name in scene.selection if name in scene.nodes]
+
+    if args:
+        patterns = []
+        for arg in args:
+            patterns.extend(arg if isinstance(arg, (list, tuple)) else [arg])
+        nodes = [n for n in nodes if any(fnmatch.fnmatchcase(n.name, p) for p in patterns)]
+
+    nodeTypes = _flag(kwargs, 'type', 'typ')
+    if nodeTypes:
+        if not isinstance(nodeTypes, (list, tuple)):
+            nodeTypes = [nodeTypes]
+        nodes = [n for n in nodes if n.type in nodeTypes]
+
+    if _flag(kwargs, 'transforms', 'tr'):
+        nodes = [n for n in nodes if n.type == 'transform']
+
+    return [n.name for n in nodes]
+
+
+@_command
+def select(*args, **kwargs):
+    if _flag(kwargs, 'clear', 'cl'):
+        del scene.selection[:]
+        return
+
+    names = []
+    for arg in args:
+        names.extend(arg if isinstance(arg, (list, tuple)) else [arg])
+    for name in names:
+        scene.node(name)
+
+    if _flag(kwargs, 'add'):
+        scene.selection.extend(n for n in names if n not in scene.selection)
+    else:
+        scene.selection[:] = names
+
+
+@_command
+def rename(obj, newName, **kwargs):
+    node = scene.node(obj)
+    if not newName:
+        raise RuntimeError('New name cannot be empty')
+
+    del scene.nodes[obj]
+    node.name = scene.uniqueName(newName)
+    scene.nodes[node.name] = node
+    scene.selection[:] = [node.name if n == obj else n for n in scene.selection]
+    return node.name
+
+
+@_command
+def delete(*args, **kwargs):
+    names = []
+    for arg in args:
+        names.extend(arg if isinstance(arg, (list, tuple)) else [arg])
+
+    for name in names:
+        node = scene.node(name)
+        for child in [node] + list(node.descendants()):
+            scene.nodes.pop(child.name, None)
+        if node.parent:
+            node.parent.children.remove(node)
+
+    scene.selection[:] = [n for n in scene.selection if n in scene.nodes]
+
+
+@_command
+def objectType(obj, **kwargs):
+    return scene.node(obj).type
+
+
+@_command
+def listRelatives(obj, shapes=False, parent=False, **kwargs):
+    node = scene.node(obj)
+    if parent:
+        return [node.parent.name] if node.parent else None
+    children = [c for c in node.children if not shapes or c.type != 'transform']
+    return [c.name for c in children] or None
+
+
+@_command
+def listAttr(obj, keyable=False, **kwargs):
+    node = scene.node(obj)
+    return list(node.keyable) if keyable else list(node.attrs)
+
+
+@_command
+def addAttr(obj, longName=None, ln=None, defaultValue=0.0, dv=None, keyable=False, k=False, **kwargs):
+    node = scene.node(obj)
+    attr = longName or ln
+    node.attrs[attr] = dv if dv is not None else defaultValue
+    if keyable or k:
+        node.keyable.append(attr)
+
+
+@_command
+def getAttr(plug, time=None, t=None, **kwargs):
+    node, attr = scene.plug(plug)
+    time = time if time is not None else t
+
+    if attr in COMPOUNDS:
+        return [tuple(_evaluate(node, child, time) for child in COMPOUNDS[attr])]
+
+    return _evaluate(node, attr, time)
+
+
+@_command
+def setAttr(plug, *values, **kwargs):
+    node, attr = scene.plug(plug)
+
+    if attr in COMPOUNDS:
+        if len(values) == 1:
+            values = values[0]
+        for child, value in zip(COMPOUNDS[attr], values):
+            node.attrs[child] = value
+        return
+
+    node.attrs[attr] = values[0]
+
+
+@_command
+def keyframe(*args, **kwargs):
+    if not _flag(kwargs, 'query', 'q'):
+        return 0
+
+    plug = args[0]
+    if '.' in plug:
+        node, attr = scene.plug(plug)
+        attrs = [attr]
+    else:
+        node = scene.node(plug)
+        attrs = list(node.keys)
+
+    times = set()
+    for attr in attrs:
+        times.update(node.keys.get(attr, ()))
+    return sorted(times) or None
+
+
+@_command
+def setKeyframe(*args, **kwargs):
+    plug = args[0]
+    time = _flag(kwargs, 'time', 't')
+    value = _flag(kwargs, 'value', 'v')
+    if time is None:
+        time = scene.currentTime
+
+    node, attr = scene.plug(plug)
+    if value is None:
+        value = node.attrs[attr]
+    node.keys.setdefault(attr, {})[time] = value
+    return 1
+
+
+@_command
+def currentTime(*args, **kwargs):
+    if _flag(kwargs, 'query', 'q'):
+        return scene.currentTime
+    if args:
+        scene.currentTime = float(args[0])
+    return scene.currentTime
+
+
+# Lights
+
+
+def _createLight(lightType, name=None):
+    transform = scene.addNode(name or '%s1' % lightType, 'transform')
+    shapeName = re.sub(r'(\d*)$', r'Shape\1', transform.name, count=1)
+    shape = scene.addNode(shapeName, lightType, transform)
+    return transform, shape
+
+
+@_command
+def pointLight(name=None, **kwargs):
+    return _createLight('pointLight', name)[1].name
+
+
+@_command
+def spotLight(name=None, **kwargs):
+    return _createLight('spotLight', name)[1].name
+
+
+@_command
+def directionalLight(name=None, **kwargs):
+    return _createLight('directionalLight', name)[1].name
+
+
+@_command
+def shadingNode(nodeType, asLight=False, name=None, **kwargs):
+    if asLight:
+        return _createLight(nodeType, name)[0].name
+    return scene.addNode(name or '%s1' % nodeType, nodeType).name
+
+
+# Files
+
+
+def _writeScene(path, nodes):
+    data = []
+    for node in nodes:
+        data.append({
+            'name': node.name,
+            'type': node.type,
+            'parent': node.parent.name if node.parent else None,
+            'attrs': node.attrs,
+            'keyable': node.keyable,
+            'keys': dict((attr, list(keys.items())) for attr, keys in node.keys.items()),
+        })
+
+    with open(path, 'w') as f:
+        f.write('//Maya ASCII scene\n')
+        json.dump(data, f)
+
+
+def _readScene(path):
+    if not os.path.exists(path):
+        raise RuntimeError('File not found: %s' % path)
+
+    with open(path, 'r') as f:
+        f.readline()
+        content = f.read()
+    data = json.loads(content) if content.strip() else []
+
+    # Imported names are made unique, so track the new name of each parent
+    names = {}
+    for item in data:
+        parent = scene.nodes.get(names.get(item['parent'])) if item['parent'] else None
+        node = scene.addNode(item['name'], item['type'], parent)
+        node.attrs.update(item['attrs'])
+        node.keyable = item['keyable']
+        node.keys = dict((attr, dict((t, v) for t, v in keys)) for attr, keys in item['keys'].items())
+        names[item['name']] = node.name
+
+
+@_command
+def file(*args, **kwargs):
+    path = args[0] if args else None
+
+    if _flag(kwargs, 'query', 'q'):
+        if _flag(kwargs, 'sceneName', 'sn'):
+            return scene.sceneName
+        return None
+
+    if _flag(kwargs, 'new', 'n'):
+        resetScene()
+        return ''
+
+    if _flag(kwargs, 'rename', 'rn'):
+        scene.sceneName = _flag(kwargs, 'rename', 'rn')
+        return scene.sceneName
+
+    if _flag(kwargs, 'open', 'o'):
+        resetScene()
+        _readScene(path)
+        scene.sceneName = path
+        return path
+
+    if _flag(kwargs, 'i', 'import'):
+        _readScene(path)
+        return path
+
+    if _flag(kwargs, 'save', 's'):
+        if not scene.sceneName:
+            raise RuntimeError('Scene has no name')
+        _writeScene(scene.sceneName, [n for n in scene.nodes.values() if n.name != 'defaultRenderGlobals'])
+        return scene.sceneName
+
+    if _flag(kwargs, 'exportSelected', 'es'):
+        target = path or scene.sceneName
+        selected = [scene.nodes[name] for name in scene.selection if name in scene.nodes]
+        nodes = []
+        for node in selected:
+            for item in [node] + list(node.descendants()):
+                if item not in nodes:
+                    nodes.append(item)
+        _writeScene(target, nodes)
+        return target
+
+    return None
+
+
+@_command
+def internalVar(userAppDir=False, **kwargs):
+    if not _userAppDir:
+        _userAppDir.append(tempfile.mkdtemp(prefix='fakeMaya'))
+    return _userAppDir[0].rstrip('/\\') + '/'
+
+
+@_command
+def playblast(completeFilename=None, **kwargs):
+    if completeFilename:
+        open(completeFilename, 'wb').close()
+    return completeFilename
+
+
+@_command
+def viewFit(*args, **kwargs):
+    pass
+
+
+@_command
+def warning(message, **kwargs):
+    logger.warning(message)
+
+
+# UI, only names are tracked
+
+
+def _uiCommand(command):
+
+    def func(*args, **kwargs):
+        name = args[0] if args else None
+
+        if _flag(kwargs, 'query', 'q'):
+            if _flag(kwargs, 'exists', 'ex'):
+                return name in scene.ui
+            return None
+        if _flag(kwargs, 'edit', 'e'):
+            return None
+
+        if not name:
+            index = len(scene.ui) + 1
+            name = '%s%s' % (command, index)
+        scene.ui.add(name)
+        return name
+
+    func.__name__ = command
+    return _command(func)
+
+
+window = _uiCommand('window')
+workspaceControl = _uiCommand('workspaceControl')
+columnLayout = _uiCommand('columnLayout')
+rowLayout = _uiCommand('rowLayout')
+text = _uiCommand('text')
+button = _uiCommand('button')
+floatSlider = _uiCommand('floatSlider')
+
+
+@_command
+def showWindow(*args, **kwargs):
+    pass
+
+
+@_command
+def setParent(*args, **kwargs):
+    pass
+
+
+@_command
+def deleteUI(*args, **kwargs):
+    for name in args:
+        if name not in scene.ui:
+            raise RuntimeError("Object '%s' not found." % name)
+        scene.ui.discard(name)
+
+
+@_command
+def colorEditor(rgbValue=None, **kwargs):
+    r, g, b = rgbValue or (1.0, 1.0, 1.0)
+    return '%s %s %s 1.0' % (r, g, b)
@@ -0,0 +1,6 @@
+def initialize(name='python'):
+    pass
+
+
+def uninitialize():
+    pass
@@ -0,0 +1 @@
+"""In-memory stand-in for pymel, built on top of the fake maya.cmds"""
@@ -0,0 +1,48 @@
+from maya import cmds
+
+from pymel.core import nodetypes
+from pymel.core.nodetypes import PyNode
+
+internalVar = cmds.internalVar
+workspaceControl = cmds.workspaceControl
+deleteUI = cmds.deleteUI
+colorEditor = cmds.colorEditor
+
+
+def _names(args):
+    names = []
+    for arg in args:
+        names.extend(arg if isinstance(arg, (list, tuple)) else [arg])
+    return [str(name) for name in names]
+
+
+def ls(*args, **kwargs):
+    return [PyNode(name) for name in cmds.ls(*_names(args), **kwargs)]
+
+
+def select(*args, **kwargs):
+    cmds.select(*_names(args), **kwargs)
+
+
+def delete(*args, **kwargs):
+    cmds.delete(*_names(args), **kwargs)
+
+
+def objectType(node, **kwargs):
+    return cmds.objectType(str(node), **kwargs)
+
+
+def pointLight(**kwargs):
+    return PyNode(cmds.pointLight(**kwargs))
+
+
+def spotLight(**kwargs):
+    return PyNode(cmds.spotLight(**kwargs))
+
+
+def directionalLight(**kwargs):
+    return PyNode(cmds.directionalLight(**kwargs))
+
+
+def shadingNode(nodeType, **kwargs):
+    return PyNode(cmds.shadingNode(nodeType, **kwargs))
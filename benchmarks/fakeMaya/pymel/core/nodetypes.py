@@ -0,0 +1,130 @@
+from maya import cmds
+
+
+class Attribute(object):
+
+    def __init__(self, node, attr):
+        self.node = node
+        self.attr = attr
+
+    def name(self):
+        return '%s.%s' % (self.node, self.attr)
+
+    def get(self, **kwargs):
+        value = cmds.getAttr(self.name(), **kwargs)
+        # Compound attributes come back from cmds as [(x, y, z)]
+        if isinstance(value, list):
+            return value[0]
+        return value
+
+    def set(self, *values, **kwargs):
+        cmds.setAttr(self.name(), *values, **kwargs)
+
+    def __str__(self):
+        return self.name()
+
+
+class DependNode(object):
+
+    def __init__(self, node):
+        # Hold the fake scene node itself so renames are followed like pymel does
+        self._node = node
+
+    def name(self):
+        return self._node.name
+
+    def nodeType(self):
+        return cmds.objectType(self.name())
+
+    def hasAttr(self, attr):
+        if attr in cmds.COMPOUNDS:
+            return all(child in self._node.attrs for child in cmds.COMPOUNDS[attr])
+        return attr in self._node.attrs
+
+    def __getattr__(self, name):
+        if name.startswith('_') or not self.hasAttr(name):
+            raise AttributeError("%r has no attribute or method named '%s'" % (self, name))
+        return Attribute(self, name)
+
+    def __str__(self):
+        return self.name()
+
+    def __repr__(self):
+        return "nt.%s(%r)" % (type(self).__name__, self.name())
+
+    def __eq__(self, other):
+        return isinstance(other, DependNode) and other._node is self._node
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return id(self._node)
+
+
+class Transform(DependNode):
+
+    def getShape(self):
+        shapes = cmds.listRelatives(self.name(), shapes=True)
+        return PyNode(shapes[0]) if shapes else None
+
+    def __getattr__(self, name):
+        try:
+            return super(Transform, self).__getattr__(name)
+        except AttributeError:
+            # Like pymel, fall back to the shape's attributes and methods
+            shape = self.getShape() if not name.startswith('_') else None
+            if shape is None:
+                raise
+            return getattr(shape, name)
+
+
+class Shape(DependNode):
+
+    def getTransform(self):
+        parents = cmds.listRelatives(self.name(), parent=True)
+        return PyNode(parents[0]) if parents else None
+
+
+class Light(Shape):
+    pass
+
+
+class PointLight(Light):
+    pass
+
+
+class SpotLight(Light):
+    pass
+
+
+class DirectionalLight(Light):
+    pass
+
+
+class AreaLight(Light):
+    pass
+
+
+class VolumeLight(Light):
+    pass
+
+
+NODE_CLASSES = {
+    'transform': Transform,
+    'pointLight': PointLight,
+    'spotLight': SpotLight,
+    'directionalLight': DirectionalLight,
+    'areaLight': AreaLight,
+    'volumeLight': VolumeLight,
+}
+
+
+class PyNode(object):
+    """A class like pymel's, constructing one returns the node class matching the node type"""
+
+    def __new__(cls, name):
+        if isinstance(name, DependNode):
+            return name
+        node = cmds.scene.node(str(name))
+        return NODE_CLASSES.get(node.type, DependNode)(node)
@@ -0,0 +1,8 @@
+from PySide2 import QtWidgets
+
+
+def wrapInstance(ptr, base):
+    # Maya controls always come with a layout to add widgets to
+    widget = base()
+    QtWidgets.QVBoxLayout(widget)
+    return widget
@@ -0,0 +1,256 @@
+"""
+Benchmarks for the tools, run against the in-memory maya.cmds/pymel/PySide2 stand-ins in fakeMaya
+so they work on any machine without Maya installed:
+
+    python benchmarks/runBenchmarks.py
+    python benchmarks/runBenchmarks.py --nodes 1000 --lights 50 --entries 100 --only tween rename
+    python benchmarks/runBenchmarks.py --json results.json
+
+Each benchmark generates a synthetic scene or library, then reports the best and median wall time
+and how many Maya commands the operation issued.
+"""
+import os
+import sys
+import json
+import logging
+import shutil
+import argparse
+import tempfile
+import collections
+from timeit import default_timer as timer
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, 'fakeMaya'))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), 'scripts'))
+
+from maya import cmds
+
+import Rename
+import tweenerUI
+import lightingManager
+from conLibrary import controllerLib
+
+# Per light messages would drown the report
+logging.getLogger('LightingManager').setLevel(logging.WARNING)
+
+
+# Scene and library generators
+
+
+def generateTweenScene(attrs, keys):
+    node = cmds.createNode('transform', name='tweenNode')
+    for i in range(attrs):
+        cmds.addAttr(node, longName='attr%s' % i, defaultValue=0.0, keyable=True)
+        for k in range(keys):
+            cmds.setKeyframe('%s.attr%s' % (node, i), time=k * 10, value=float(k * i % 17))
+
+    # Sit between two keys so every attribute gets tweened
+    cmds.currentTime(keys * 5 + 5)
+    cmds.select(node)
+    return node
+
+
+def generateRenameScene(nodes, matchEvery=10):
+    # One in every matchEvery nodes contains the search word
+    for i in range(nodes):
+        if i % matchEvery:
+            cmds.createNode('transform', name='geo_%s' % i)
+        else:
+            cmds.createNode('transform', name='ctrl_%s' % i)
+
+
+def generateLights(count):
+    creators = [cmds.pointLight, cmds.spotLight, cmds.directionalLight,
+                lambda: cmds.shadingNode('areaLight', asLight=True),
+                lambda: cmds.shadingNode('volumeLight', asLight=True)]
+    for i in range(count):
+        creators[i % len(creators)]()
+
+
+def generateLibrary(directory, entries):
+    for i in range(entries):
+        name = 'ctrl%s' % i
+        with open(os.path.join(directory, '%s.ma' % name), 'w') as f:
+            f.write('//Maya ASCII scene\n[]')
+        with open(os.path.join(directory, '%s.json' % name), 'w') as f:
+            json.dump({'name': name, 'path': os.path.join(directory, '%s.ma' % name), 'index': i}, f, indent=4)
+        # Only half of the entries have thumbnails
+        if i % 2:
+            open(os.path.join(directory, '%s.jpg' % name), 'wb').close()
+
+
+# Benchmarks, each returns a (setup, run) pair. setup runs before every repeat and returns
+# the state passed to run, only run is timed.
+
+
+def tweenBenchmark(args):
+
+    def setup():
+        cmds.resetScene()
+        return generateTweenScene(args.attrs, args.keys)
+
+    def run(node):
+        tweenerUI.tween(50, obj=node)
+
+    return '%s attrs x %s keys' % (args.attrs, args.keys), setup, run
+
+
+def renameBenchmark(args):
+
+    def setup():
+        cmds.resetScene()
+        generateRenameScene(args.nodes)
+        ui = Rename.RenameUI()
+        ui.search_field.setText('ctrl')
+        ui.replace_field.setText('anim')
+        return ui
+
+    def run(ui):
+        ui.replace()
+
+    return '%s nodes' % args.nodes, setup, run
+
+
+def findBenchmark(args):
+    directory = tempfile.mkdtemp(prefix='controllerLib')
+    generateLibrary(directory, args.entries)
+    temporary.append(directory)
+
+    def setup():
+        return controllerLib.ControllerLibrary()
+
+    def run(library):
+        library.find(directory)
+
+    return '%s entries' % args.entries, setup, run
+
+
+def populateBenchmark(args):
+
+    def setup():
+        cmds.resetScene()
+        generateLights(args.lights)
+        # Building the manager populates once, the timed run is a refresh
+        return lightingManager.LightManager()
+
+    def run(manager):
+        manager.populate()
+
+    return '%s lights' % args.lights, setup, run
+
+
+def saveLightsBenchmark(args):
+    directory = tempfile.mkdtemp(prefix='lightManager')
+    temporary.append(directory)
+
+    def setup():
+        cmds.resetScene()
+        generateLights(args.lights)
+        return os.path.join(directory, 'lights.json')
+
+    def run(lightFile):
+        lightingManager.saveLightFile(lightFile)
+
+    return '%s lights' % args.lights, setup, run
+
+
+def importLightsBenchmark(args):
+    directory = tempfile.mkdtemp(prefix='lightManager')
+    temporary.append(directory)
+    lightFile = os.path.join(directory, 'lights.json')
+
+    cmds.resetScene()
+    generateLights(args.lights)
+    lightingManager.saveLightFile(lightFile)
+
+    def setup():
+        cmds.resetScene()
+        return lightFile
+
+    def run(lightFile):
+        lightingManager.importLightFile(lightFile)
+
+    return '%s lights' % args.lights, setup, run
+
+
+BENCHMARKS = collections.OrderedDict([
+    ('tween', tweenBenchmark),
+    ('rename', renameBenchmark),
+    ('find', findBenchmark),
+    ('populate', populateBenchmark),
+    ('saveLights', saveLightsBenchmark),
+    ('importLights', importLightsBenchmark),
+])
+
+temporary = []
+
+
+def runBenchmark(name, args):
+    size, setup, run = BENCHMARKS[name](args)
+
+    timings = []
+    for _ in range(args.repeat):
+        state = setup()
+        cmds.resetCallCounts()
+
+        start = timer()
+        run(state)
+        timings.append(timer() - start)
+
+    # Every repeat does the same work, so the counts of the last one stand for all
+    commands = collections.Counter(cmds.callCounts)
+    timings.sort()
+
+    return {
+        'name': name,
+        'size': size,
+        'best': timings[0],
+        'median': timings[len(timings) // 2],
+        'calls': sum(commands.values()),
+        'commands': dict(commands),
+    }
+
+
+def report(results):
+    print('%-14s %-24s %10s %10s %10s  %s' % ('benchmark', 'size', 'best (s)', 'median (s)', 'maya calls', 'top commands'))
+    for result in results:
+        top = sorted(result['commands'].items(), key=lambda item: -item[1])[:3]
+        print('%-14s %-24s %10.4f %10.4f %10d  %s' % (
+            result['name'], result['size'], result['best'], result['median'], result['calls'],
+            ', '.join('%s=%s' % item for item in top)))
+
+
+def buildParser():
+    parser = argparse.ArgumentParser(description='Benchmark the tools against a fake Maya scene')
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help='Benchmarks to run, default all')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per benchmark')
+    parser.add_argument('--nodes', type=int, default=100000, help='Nodes in the rename scene')
+    parser.add_argument('--lights', type=int, default=5000, help='Lights in the lighting scenes')
+    parser.add_argument('--entries', type=int, default=10000, help='Controller library entries')
+    parser.add_argument('--attrs', type=int, default=1000, help='Keyed attributes on the tween node')
+    parser.add_argument('--keys', type=int, default=20, help='Keys per tweened attribute')
+    parser.add_argument('--json', help='Also write the results to this json file')
+    return parser
+
+
+def main(argv=None):
+    args = buildParser().parse_args(argv)
+
+    try:
+        results = [runBenchmark(name, args) for name in args.only or BENCHMARKS]
+    finally:
+        for directory in temporary:
+            shutil.rmtree(directory, ignore_errors=True)
+        cmds.cleanUserAppDir()
+
+    report(results)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=4)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
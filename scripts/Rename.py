@@ -1,6 +1,10 @@
 import maya.cmds as cmds
 from PySide2 import QtWidgets, QtCore
 
+import instrument
+
+cmds = instrument.commands(cmds)
+
 
 class RenameUI(QtWidgets.QWidget):
     def __init__(self):
@@ -49,33 +53,43 @@ class RenameUI(QtWidgets.QWidget):
 
     def rename(self):
         """Rename selected object"""
-        # Get new name from field
-        new_name = self.rename_field.text()
+        with instrument.Action('RenameUI.rename') as action:
+            # Get new name from field
+            new_name = self.rename_field.text()
+
+            # Get selected objects
+            selected_objects = cmds.ls(selection=True)
 
-        # Get selected objects
-        selected_objects = cmds.ls(selection=True)
+            # Rename selected objects
+            for obj in selected_objects:
+                cmds.rename(obj, new_name)
 
-        # Rename selected objects
-        for obj in selected_objects:
-            cmds.rename(obj, new_name)
+            action.set('renamed', len(selected_objects))
 
     def replace(self):
         """Search all objects and replace the same word"""
-        search_name = self.search_field.text()
-        replace_name = self.replace_field.text()
-        all_objects = cmds.ls()
-        objects_to_rename = []
-
-        for obj in all_objects:
-            if search_name in obj:
-                objects_to_rename.append(obj)
-
-        for obj in objects_to_rename:
-            new_replace_name = obj.replace(search_name, replace_name)
-            try:
-                cmds.rename(obj, new_replace_name)
-            except:
-                print("Failed to rename object: {}".format(obj))
+        with instrument.Action('RenameUI.replace') as action:
+            search_name = self.search_field.text()
+            replace_name = self.replace_field.text()
+            all_objects = cmds.ls()
+            objects_to_rename = []
+            failed = 0
+
+            for obj in all_objects:
+                if search_name in obj:
+                    objects_to_rename.append(obj)
+
+            for obj in objects_to_rename:
+                new_replace_name = obj.replace(search_name, replace_name)
+                try:
+                    cmds.rename(obj, new_replace_name)
+                except:
+                    failed += 1
+                    print("Failed to rename object: {}".format(obj))
+
+            action.set('objects', len(all_objects))
+            action.set('renamed', len(objects_to_rename) - failed)
+            action.set('failed', failed)
 
 
 def showUI():
@@ -0,0 +1,455 @@
+"""
+Headless batch runner for the controller library and lighting manager.
+
+Run it with mayapy so every worker process can start its own Maya standalone session. Workers stay
+alive and reset to an empty scene between scenes, --isolate gives every scene a fresh Maya instead:
+
+    mayapy batchTools.py library ~/maya/controllerLib --jobs 8
+    mayapy batchTools.py export-lights shots/ --output rigs/ --jobs 8
+    mayapy batchTools.py import-lights shots/*.ma --rig rigs/key.json --jobs 8
+
+Scene arguments can be files or directories, directories are searched for .ma/.mb files.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import itertools
+import collections
+import multiprocessing
+
+try:
+    from Queue import Empty
+except ImportError:
+    # Python 3 Maya
+    from queue import Empty
+
+import logging
+
+from maya import cmds
+
+import instrument
+
+cmds = instrument.commands(cmds)
+
+logging.basicConfig()
+logger = logging.getLogger('BatchTools')
+logger.setLevel(logging.INFO)
+
+SCENE_EXTENSIONS = ('.ma', '.mb')
+
+# ControllerLibrary only knows mayaAscii entries
+LIBRARY_EXTENSIONS = ('.ma',)
+
+
+# Seconds a scene may run before its worker is treated as hung and killed
+TIMEOUT = 1800
+
+# Seconds the parent waits for worker messages before checking on the workers
+POLL = 0.5
+
+# Set by initializeWorker when Maya fails to start
+_initializeError = []
+
+
+def initializeWorker():
+    # Every worker gets its own Maya session
+    try:
+        import maya.standalone
+        maya.standalone.initialize(name='python')
+        # Standalone only now fills in maya.cmds, pick up the new commands
+        instrument.commands(cmds)
+    except Exception as e:
+        _initializeError.append('%s: %s' % (type(e).__name__, e))
+
+
+def openScene(path):
+    cmds.file(path, open=True, force=True)
+
+
+def rebuildLibraryEntry(path):
+    """
+    Re-save a controller library entry and its info file from the scene on disk, an existing
+    thumbnail is kept as it is, standalone Maya has no viewport to playblast from
+    Args:
+        path: The .ma file of the library entry
+
+    Returns:
+        The path of the info file
+    """
+    from conLibrary import controllerLib
+
+    directory, fileName = os.path.split(path)
+    name = os.path.splitext(fileName)[0]
+
+    # Keep any extra info that was saved with the entry, only this entry's file is read
+    info = {}
+    infoFile = os.path.join(directory, '%s.json' % name)
+    if os.path.exists(infoFile):
+        with open(infoFile, 'r') as f:
+            info = json.load(f)
+    for key in ('name', 'path', 'screenshot'):
+        info.pop(key, None)
+
+    library = controllerLib.ControllerLibrary()
+    openScene(path)
+    library.save(name, directory=directory, screenshot=False, **info)
+
+    return os.path.join(directory, '%s.json' % name)
+
+
+def exportLightRig(path, output):
+    """
+    Save every light in a scene to a light file named after the scene
+    Args:
+        path: The scene to export from
+        output: The directory to write the light file to
+
+    Returns:
+        The path of the light file
+    """
+    import lightingManager
+
+    openScene(path)
+
+    name = os.path.splitext(os.path.basename(path))[0]
+    lightFile = os.path.join(output, '%s.json' % name)
+    return lightingManager.saveLightFile(lightFile)
+
+
+def importLightRig(path, rig):
+    """
+    Import a light file into a scene and save the scene
+    Args:
+        path: The scene to import into
+        rig: The light file to import
+
+    Returns:
+        The path of the saved scene
+    """
+    import lightingManager
+
+    openScene(path)
+    lightingManager.importLightFile(rig)
+    cmds.file(save=True, force=True)
+
+    return path
+
+
+OPERATIONS = {
+    'library': rebuildLibraryEntry,
+    'export-lights': exportLightRig,
+    'import-lights': importLightRig,
+}
+
+
+def runTask(task):
+    # Runs inside the worker, never raise so one bad scene doesn't stop the worker
+    operation, path, kwargs = task
+    start = time.time()
+
+    with instrument.Action('batch.%s' % operation, scene=path) as action:
+        try:
+            result = OPERATIONS[operation](path, **kwargs)
+            error = None
+        except Exception as e:
+            result = None
+            error = '%s: %s' % (type(e).__name__, e)
+            action.set('error', error)
+
+    return {
+        'operation': operation,
+        'scene': path,
+        'result': result,
+        'error': error,
+        'seconds': time.time() - start,
+        'commandCount': action.record['commandCount'] if action.record else None,
+    }
+
+
+def findScenes(paths, extensions=SCENE_EXTENSIONS):
+    scenes = []
+
+    for path in paths:
+        if os.path.isdir(path):
+            for fileName in sorted(os.listdir(path)):
+                if fileName.endswith(extensions):
+                    scenes.append(os.path.join(path, fileName))
+        else:
+            scenes.append(path)
+
+    return scenes
+
+
+def workerLoop(workerId, inbox, outbox, isolate):
+    """
+    Runs in each worker process, starts Maya then runs the scenes sent to inbox until it gets None
+    Args:
+        workerId: Sent back with every message so the parent knows who is talking
+        inbox: Queue of tasks for this worker
+        outbox: Queue shared by all workers for (workerId, kind, payload) messages
+        isolate: Exit after one scene
+    """
+    initializeWorker()
+    if _initializeError:
+        outbox.put((workerId, 'fatal', 'Maya failed to initialize, %s' % _initializeError[0]))
+        return
+
+    outbox.put((workerId, 'ready', None))
+
+    try:
+        while True:
+            task = inbox.get()
+            if task is None:
+                return
+
+            outbox.put((workerId, 'done', runTask(task)))
+            if isolate:
+                return
+
+            # Start the next scene from an empty one
+            try:
+                cmds.file(new=True, force=True)
+            except Exception as e:
+                logger.warning('Could not reset the scene, %s: %s' % (type(e).__name__, e))
+    finally:
+        # Workers are stopped without running atexit, each one writes its own trace
+        instrument.writeTrace(perProcess=True)
+
+
+class Worker(object):
+    """The parent's handle on one worker process and the scene it is running"""
+
+    def __init__(self, workerId, outbox, isolate):
+        self.id = workerId
+        self.inbox = multiprocessing.Queue()
+        self.process = multiprocessing.Process(target=workerLoop, args=(workerId, self.inbox, outbox, isolate))
+        self.process.daemon = True
+        self.process.start()
+
+        self.ready = False
+        self.task = None
+        self.started = None
+
+    def run(self, task):
+        self.task = task
+        self.started = time.time()
+        self.inbox.put(task)
+
+    def stop(self):
+        if self.process.is_alive():
+            self.inbox.put(None)
+
+    def kill(self):
+        self.process.terminate()
+        self.process.join(5)
+
+
+def _messages(queue, timeout):
+    # Wait for the first message, then take whatever else has already arrived
+    messages = []
+    try:
+        messages.append(queue.get(timeout=timeout))
+        while True:
+            messages.append(queue.get_nowait())
+    except Empty:
+        pass
+    return messages
+
+
+def _failed(task, error, seconds):
+    operation, path, kwargs = task
+    return {
+        'operation': operation,
+        'scene': path,
+        'result': None,
+        'error': error,
+        'seconds': seconds,
+    }
+
+
+def runBatch(operation, scenes, jobs=None, timeout=TIMEOUT, isolate=False, **kwargs):
+    """
+    Spread scenes across a pool of Maya worker processes
+    Args:
+        operation: One of the OPERATIONS keys
+        scenes: The scene files to process
+        jobs: Number of worker processes, defaults to the cpu count
+        timeout: Seconds a scene may run before its worker is killed and the scene reported failed
+        isolate: Start a fresh worker, and so a fresh Maya, for every scene
+
+    Returns:
+        A list of result dicts, one per processed scene, in completion order
+    """
+    tasks = collections.deque((operation, scene, kwargs) for scene in scenes)
+    total = len(tasks)
+    jobs = max(1, min(jobs or multiprocessing.cpu_count(), total or 1))
+
+    logger.info('Running %s on %s scenes with %s workers' % (operation, total, jobs))
+
+    results = []
+    start = time.time()
+
+    outbox = multiprocessing.Queue()
+    workers = {}
+    # Isolated workers that finished their scene and are exiting by themselves
+    retired = []
+    workerIds = itertools.count()
+    fatal = []
+
+    def spawn():
+        worker = Worker(next(workerIds), outbox, isolate)
+        workers[worker.id] = worker
+
+    def finish(worker, result):
+        worker.task = None
+        results.append(result)
+
+        status = 'failed' if result['error'] else 'ok'
+        logger.info('[%s/%s] %s %.2fs %s' % (len(results), total, status, result['seconds'], result['scene']))
+        if result['error']:
+            logger.error(result['error'])
+
+    def handle(messages):
+        for workerId, kind, payload in messages:
+            worker = workers.get(workerId)
+            if worker is None:
+                continue
+            if kind == 'fatal':
+                fatal.append(payload)
+            elif kind == 'ready':
+                worker.ready = True
+            elif kind == 'done':
+                finish(worker, payload)
+                if isolate:
+                    retired.append(workers.pop(workerId))
+
+    try:
+        for _ in range(jobs):
+            spawn()
+
+        while not fatal and (tasks or any(w.task for w in workers.values())):
+            handle(_messages(outbox, POLL))
+
+            for worker in list(workers.values()):
+                if worker.task is not None and time.time() - worker.started > timeout:
+                    # Only this scene fails, the queued ones go to a new worker
+                    worker.kill()
+                    del workers[worker.id]
+                    finish(worker, _failed(worker.task, 'Timed out after %ss, the worker was killed' % timeout,
+                                           time.time() - worker.started))
+
+                elif not worker.process.is_alive():
+                    # Its last message may still be on the way
+                    if worker.task is not None or not worker.ready:
+                        handle(_messages(outbox, POLL))
+                    del workers[worker.id]
+
+                    if worker.task is not None:
+                        finish(worker, _failed(worker.task, 'The worker died, exit code %s' % worker.process.exitcode,
+                                               time.time() - worker.started))
+                    elif not worker.ready and not fatal:
+                        fatal.append('A worker died while starting Maya, exit code %s' % worker.process.exitcode)
+
+            # Keep the pool full while there are scenes left
+            while tasks and len(workers) < jobs:
+                spawn()
+
+            for worker in workers.values():
+                if tasks and worker.ready and worker.task is None and worker.process.is_alive():
+                    worker.run(tasks.popleft())
+
+        if fatal:
+            logger.error(fatal[0])
+            logger.error('Aborting, %s scenes not run' % (total - len(results)))
+    finally:
+        for worker in workers.values():
+            worker.stop()
+        for worker in list(workers.values()) + retired:
+            worker.process.join(30)
+            if worker.process.is_alive():
+                worker.kill()
+
+    failed = len([r for r in results if r['error']])
+    logger.info('Finished %s scenes in %.2fs, %s failed' % (len(results), time.time() - start, failed))
+
+    return results
+
+
+def buildParser():
+    # Options every operation takes, given after the operation name
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--jobs', '-j', type=int, default=None, help='Number of worker processes')
+    common.add_argument('--report', help='Write per scene results and timings to this json file')
+    common.add_argument('--timeout', type=float, default=TIMEOUT,
+                        help='Seconds a scene may run before its worker is killed and the scene reported failed')
+    common.add_argument('--isolate', action='store_true',
+                        help='Start a fresh Maya for every scene instead of reusing workers')
+
+    parser = argparse.ArgumentParser(description='Run controller library and lighting manager operations headless')
+
+    subparsers = parser.add_subparsers(dest='operation')
+    subparsers.required = True
+
+    library = subparsers.add_parser('library', parents=[common], help='Rebuild controller library info files')
+    library.add_argument('scenes', nargs='+', help='Library entries or library directories')
+
+    exportLights = subparsers.add_parser('export-lights', parents=[common],
+                                         help='Save the lights of each scene to a light file')
+    exportLights.add_argument('scenes', nargs='+', help='Scene files or directories')
+    exportLights.add_argument('--output', '-o', required=True, help='Directory to write the light files to')
+
+    importLights = subparsers.add_parser('import-lights', parents=[common],
+                                         help='Import a light file into each scene and save it')
+    importLights.add_argument('scenes', nargs='+', help='Scene files or directories')
+    importLights.add_argument('--rig', '-r', required=True, help='The light file to import')
+
+    return parser
+
+
+def main(argv=None):
+    args = buildParser().parse_args(argv)
+
+    extensions = SCENE_EXTENSIONS
+
+    if args.operation == 'library':
+        kwargs = {}
+        extensions = LIBRARY_EXTENSIONS
+    elif args.operation == 'export-lights':
+        if not os.path.exists(args.output):
+            os.makedirs(args.output)
+        kwargs = {'output': os.path.abspath(args.output)}
+    else:
+        kwargs = {'rig': os.path.abspath(args.rig)}
+
+    scenes = [os.path.abspath(scene) for scene in findScenes(args.scenes, extensions)]
+    if not scenes:
+        logger.error('No scenes found')
+        return 1
+
+    if args.operation == 'export-lights':
+        # Light files are named after the scene, parallel workers would overwrite each other
+        names = collections.defaultdict(list)
+        for scene in scenes:
+            names[os.path.splitext(os.path.basename(scene))[0]].append(scene)
+
+        duplicates = [paths for paths in names.values() if len(paths) > 1]
+        if duplicates:
+            for paths in duplicates:
+                logger.error('Scenes would write the same light file: %s' % ', '.join(paths))
+            return 1
+
+    results = runBatch(args.operation, scenes, jobs=args.jobs, timeout=args.timeout,
+                       isolate=args.isolate, **kwargs)
+
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump(results, f, indent=4)
+        logger.info('Saving report to %s' % args.report)
+
+    return 1 if len(results) < len(scenes) or any(r['error'] for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
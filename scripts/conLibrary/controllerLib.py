@@ -4,6 +4,10 @@ import pprint
 
 from maya import cmds
 
+import instrument
+
+cmds = instrument.commands(cmds)
+
 
 USERAPPDIR = cmds.internalVar(userAppDir=True)
 DIRECTORY = os.path.join(USERAPPDIR, 'controllerLib')
@@ -24,6 +28,7 @@ def createDirectory(directory=DIRECTORY):
 
 class ControllerLibrary(dict):
 
+    @instrument.Action('ControllerLibrary.save')
     def save(self, name, directory=DIRECTORY, screenshot=True, **info):
         createDirectory(directory)
 
@@ -43,11 +48,13 @@ class ControllerLibrary(dict):
         if screenshot:
             info['screenshot'] = self.saveScreenshot(name, directory=directory)
 
-        with open(infoFile, 'w') as f:
-            json.dump(info, f, indent=4)
+        with instrument.Phase('json'):
+            with open(infoFile, 'w') as f:
+                json.dump(info, f, indent=4)
 
         self[name] = info
 
+    @instrument.Action('ControllerLibrary.find')
     def find(self, directory=DIRECTORY):
         """
         Find ctrls in disk
@@ -59,7 +66,8 @@ class ControllerLibrary(dict):
         if not os.path.exists(directory):
             return
 
-        files = os.listdir(directory)
+        with instrument.Phase('disk'):
+            files = os.listdir(directory)
         mayaFiles = [f for f in files if f.endswith('.ma')]
 
         for ma in mayaFiles:
@@ -70,8 +78,12 @@ class ControllerLibrary(dict):
             if infoFile in files:
                 infoFile = os.path.join(directory, infoFile)
 
-                with open(infoFile, 'r') as f:
-                    info = json.load(f)
+                with instrument.Phase('disk'):
+                    with open(infoFile, 'r') as f:
+                        data = f.read()
+
+                with instrument.Phase('json'):
+                    info = json.loads(data)
             else:
                 info = {}
 
@@ -84,7 +96,7 @@ class ControllerLibrary(dict):
 
             self[name] = info
 
-
+    @instrument.Action('ControllerLibrary.load')
     def load(self, name):
         path = self[name]['path']
         cmds.file(path, i=True, usingNamespaces=False)
@@ -2,9 +2,12 @@ import pprint
 from PySide2 import QtWidgets, QtCore, QtGui
 from maya import cmds
 
+import instrument
 import controllerLib
 reload(controllerLib)
 
+cmds = instrument.commands(cmds)
+
 
 class ControllerLibraryUI(QtWidgets.QDialog):
     """
@@ -71,19 +74,23 @@ class ControllerLibraryUI(QtWidgets.QDialog):
 
     def populate(self):
         """This clears the listWidget and then repopulates it with the contents of our lib"""
-        self.listWidget.clear()
-        self.library.find()
+        with instrument.Action('ControllerLibraryUI.populate') as action:
+            self.listWidget.clear()
+            self.library.find()
+
+            for name, info in self.library.items():
+                item = QtWidgets.QListWidgetItem(name)
+                self.listWidget.addItem(item)
 
-        for name, info in self.library.items():
-            item = QtWidgets.QListWidgetItem(name)
-            self.listWidget.addItem(item)
+                screenshot = info.get('screenshot')
+                if screenshot:
+                    with instrument.Phase('icons'):
+                        icon = QtGui.QIcon(screenshot)
+                    item.setIcon(icon)
 
-            screenshot = info.get('screenshot')
-            if screenshot:
-                icon = QtGui.QIcon(screenshot)
-                item.setIcon(icon)
+                item.setToolTip(pprint.pformat(info))
 
-            item.setToolTip(pprint.pformat(info))
+            action.set('entries', len(self.library))
 
     def load(self):
         """This loads the current selected controller"""
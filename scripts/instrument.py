@@ -0,0 +1,343 @@
+"""
+Opt-in instrumentation shared by all the tools.
+
+Each user action (tween, rename, find, populate, save/import lights...) is wrapped in an action that
+records its wall time, the Maya commands it issued and time spent in named phases such as disk, json
+or icons. Nothing is recorded until it is enabled, either in Maya:
+
+    import instrument
+    instrument.enable(logFile='/tmp/techart.jsonl', traceFile='/tmp/techart_{pid}.json')
+
+or for a whole session/batch job with environment variables:
+
+    TECHART_INSTRUMENT=1                       log a summary line per action
+    TECHART_INSTRUMENT_LOG=/path/actions.jsonl append one json record per action
+    TECHART_INSTRUMENT_TRACE=/path/trace.json  write a Chrome trace (chrome://tracing, Perfetto)
+
+The json lines log is meant to be collected across machines, every record carries host, user and pid.
+{pid} in a path is replaced by the process id, so batch workers don't overwrite each other's traces.
+
+Modules mark the command module they use:
+
+    from maya import cmds
+    cmds = instrument.commands(cmds)
+
+While enabled, the functions of maya.cmds and pymel.internal.pmcmds are wrapped in place. pymel.core
+and pymel attribute get/set go through those, so they are counted too without touching pymel.core
+itself. Only plain and builtin functions are wrapped, objects such as pm.optionVar are left alone.
+A command issued by another command only counts once. disable() puts the original functions back.
+"""
+import os
+import sys
+import json
+import time
+import atexit
+import socket
+import getpass
+import logging
+import functools
+import threading
+import collections
+import types
+from timeit import default_timer as timer
+
+logger = logging.getLogger('Instrument')
+logger.setLevel(logging.INFO)
+
+ENABLE_ENV = 'TECHART_INSTRUMENT'
+LOG_ENV = 'TECHART_INSTRUMENT_LOG'
+TRACE_ENV = 'TECHART_INSTRUMENT_TRACE'
+
+# Completed top level actions, kept for inspection from the script editor
+records = collections.deque(maxlen=1000)
+
+_settings = {'enabled': False, 'logFile': None, 'traceFile': None, 'atexit': False}
+_stack = []
+# Only the latest events are kept, a long interactive session drops the oldest ones
+_traceEvents = collections.deque(maxlen=100000)
+
+COMMAND_MODULES = ('maya.cmds', 'pymel.internal.pmcmds')
+
+COMMAND_TYPES = (types.FunctionType, types.BuiltinFunctionType)
+
+# Original functions of the patched command modules, by module id
+_originals = {}
+# Non empty while a counted command runs
+_inCommand = []
+
+
+def enable(logFile=None, traceFile=None):
+    """
+    Start recording actions
+    Args:
+        logFile: Append a json record per top level action to this file
+        traceFile: Write a Chrome trace of the latest actions to this file on disable or exit
+    """
+    _settings['enabled'] = True
+    _settings['logFile'] = logFile
+    _settings['traceFile'] = traceFile
+
+    if traceFile and not _settings['atexit']:
+        atexit.register(writeTrace)
+        _settings['atexit'] = True
+
+    _patchAll()
+
+
+def disable():
+    """Stop recording and write out the trace, if any"""
+    writeTrace()
+    _settings['enabled'] = False
+    del _stack[:]
+    _traceEvents.clear()
+    _restore()
+
+
+def isEnabled():
+    return _settings['enabled']
+
+
+def _path(path, perProcess=False):
+    if perProcess and '{pid}' not in path:
+        root, ext = os.path.splitext(path)
+        path = '%s_{pid}%s' % (root, ext)
+    return path.replace('{pid}', str(os.getpid()))
+
+
+def writeTrace(path=None, perProcess=False):
+    """
+    Write the latest recorded actions as Chrome trace events
+    Args:
+        path: Defaults to the traceFile given to enable
+        perProcess: Add the process id to the file name if the path has no {pid}
+
+    Returns:
+        The path written to, or None
+    """
+    path = path or _settings['traceFile']
+    if not path or not _traceEvents:
+        return None
+
+    path = _path(path, perProcess)
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': list(_traceEvents), 'displayTimeUnit': 'ms'}, f)
+
+    return path
+
+
+def _current():
+    return _stack[-1] if _stack else None
+
+
+def _countCommand(name, seconds):
+    record = _current()
+    if record is None:
+        return
+
+    command = record['commands'].setdefault(name, {'count': 0, 'seconds': 0.0})
+    command['count'] += 1
+    command['seconds'] += seconds
+
+
+def _merge(target, source):
+    # Sum {name: {'count', 'seconds'}} dicts
+    for name, value in source.items():
+        item = target.setdefault(name, {'count': 0, 'seconds': 0.0})
+        item['count'] += value['count']
+        item['seconds'] += value['seconds']
+
+
+def _finish(record):
+    record['host'] = socket.gethostname()
+    record['user'] = getpass.getuser()
+    record['pid'] = os.getpid()
+    records.append(record)
+
+    logger.info('%s took %.1fms, %s maya commands' % (record['name'], record['seconds'] * 1000,
+                                                      record['commandCount']))
+
+    logFile = _settings['logFile']
+    if logFile:
+        with open(_path(logFile), 'a') as f:
+            f.write(json.dumps(record) + '\n')
+
+
+class Action(object):
+    """
+    Times a user action and counts the Maya commands it issues, use it as a context manager or decorator:
+
+        with instrument.Action('ControllerLibrary.find', directory=directory):
+            ...
+
+        @instrument.Action('tween')
+        def tween(...):
+    """
+
+    def __init__(self, name, **info):
+        self.name = name
+        self.info = info
+        self.record = None
+
+    def __enter__(self):
+        if not _settings['enabled']:
+            return self
+
+        self.record = {
+            'name': self.name,
+            'start': time.time(),
+            'seconds': 0.0,
+            'commandCount': 0,
+            'commands': {},
+            'phases': {},
+            'info': dict(self.info),
+            'children': [],
+        }
+        _stack.append(self.record)
+        self._start = timer()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        record = self.record
+        if record is None or not _stack or _stack[-1] is not record:
+            return False
+
+        record['seconds'] = timer() - self._start
+        _stack.pop()
+
+        if excType is not None:
+            record['error'] = '%s: %s' % (excType.__name__, excValue)
+
+        # Nested actions count towards their parent
+        for child in record['children']:
+            _merge(record['commands'], child['commands'])
+            _merge(record['phases'], child['phases'])
+        record['commandCount'] = sum(c['count'] for c in record['commands'].values())
+
+        if _settings['traceFile']:
+            _traceEvents.append({
+                'name': record['name'],
+                'cat': 'techart',
+                'ph': 'X',
+                'ts': record['start'] * 1e6,
+                'dur': record['seconds'] * 1e6,
+                'pid': os.getpid(),
+                'tid': threading.current_thread().ident,
+                'args': {'commandCount': record['commandCount'], 'info': record['info'],
+                         'phases': record['phases']},
+            })
+
+        parent = _current()
+        if parent is not None:
+            parent['children'].append(record)
+        else:
+            _finish(record)
+
+        return False
+
+    def set(self, key, value):
+        """Attach extra info such as item counts to the record"""
+        if self.record is not None:
+            self.record['info'][key] = value
+
+    def __call__(self, func):
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with Action(self.name, **self.info):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+class Phase(object):
+    """
+    Adds the time of a block to a named phase of the current action, e.g. disk, json or icons:
+
+        with instrument.Phase('json'):
+            info = json.load(f)
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.record = None
+
+    def __enter__(self):
+        self.record = _current()
+        if self.record is not None:
+            self._start = timer()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if self.record is not None:
+            _merge(self.record['phases'], {self.name: {'count': 1, 'seconds': timer() - self._start}})
+        return False
+
+
+def _counted(name, func):
+
+    def wrapper(*args, **kwargs):
+        # Commands issued by another counted command, e.g. pymel calling maya.cmds, count once
+        if not _stack or _inCommand:
+            return func(*args, **kwargs)
+
+        _inCommand.append(name)
+        start = timer()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _inCommand.pop()
+            _countCommand(name, timer() - start)
+
+    # Maya commands are builtins, which functools.wraps can't copy from on Python 2
+    wrapper.__name__ = name
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+
+def _patch(module):
+    # Re-scanning is fine, mayapy only fills maya.cmds in on maya.standalone.initialize
+    originals = _originals.setdefault(id(module), (module, {}))[1]
+
+    for name in dir(module):
+        if name.startswith('_') or name in originals:
+            continue
+
+        attr = getattr(module, name)
+        if not isinstance(attr, COMMAND_TYPES):
+            continue
+
+        originals[name] = attr
+        setattr(module, name, _counted(name, attr))
+
+
+def _patchAll():
+    for name in COMMAND_MODULES:
+        if name in sys.modules:
+            _patch(sys.modules[name])
+
+
+def _restore():
+    for module, originals in _originals.values():
+        for name, attr in originals.items():
+            setattr(module, name, attr)
+    _originals.clear()
+
+
+def commands(module):
+    """
+    Count the Maya commands called through a command module such as maya.cmds or pymel.core
+    Args:
+        module: The command module, the commands underneath it are counted while instrumentation is enabled
+
+    Returns:
+        The same module
+    """
+    # Picks up command modules imported since enable, e.g. pymel or a freshly initialized maya.cmds
+    if _settings['enabled']:
+        _patchAll()
+
+    return module
+
+
+if os.environ.get(ENABLE_ENV) or os.environ.get(LOG_ENV) or os.environ.get(TRACE_ENV):
+    enable(logFile=os.environ.get(LOG_ENV), traceFile=os.environ.get(TRACE_ENV))
@@ -1,4 +1,9 @@
-from __builtin__ import long
+try:
+    from __builtin__ import long, basestring
+except ImportError:
+    # Python 3 Maya
+    long = int
+    basestring = str
 from PySide2 import QtWidgets, QtCore, QtGui
 import pymel.core as pm
 from functools import partial
@@ -10,6 +15,10 @@ from maya import OpenMayaUI as omui
 
 import logging
 
+import instrument
+
+pm = instrument.commands(pm)
+
 logging.basicConfig()
 logger = logging.getLogger('LightingManager')
 logger.setLevel(logging.DEBUG)
@@ -37,14 +46,105 @@ def deleteDock(name='LightingManagerDock'):
         pm.deleteUI(name)
 
 
+LIGHT_SHAPES = ["areaLight", "spotLight", "pointLight", "directionalLight", "volumeLight"]
+
+LIGHT_TYPES = {
+    "Point Light": pm.pointLight,
+    "Spot Light": pm.spotLight,
+    "Direction Light": pm.directionalLight,
+    "Area Light": partial(pm.shadingNode, 'areaLight', asLight=True),
+    "Volume Light": partial(pm.shadingNode, 'volumeLight', asLight=True),
+}
+
+
+def getLightDirectory():
+    # Get saved file path
+    directory = os.path.join(pm.internalVar(userAppDir=True), 'lightManager')
+    if not os.path.exists(directory):
+        os.mkdir(directory)
+    return directory
+
+
+@instrument.Action('getLightProperties')
+def getLightProperties(lights=None):
+    # Collect light data, default to every light in scene
+    if lights is None:
+        lights = pm.ls(type=LIGHT_SHAPES)
+
+    properties = {}
+
+    for light in lights:
+        # Get light transform attr
+        transform = light.getTransform()
+
+        # Save data in properties
+        properties[str(transform)] = {
+            'translate': list(transform.translate.get()),
+            'rotate': list(transform.rotate.get()),
+            'lightType': pm.objectType(light),
+            'intensity': light.intensity.get(),
+            'color': light.color.get()
+        }
+
+    return properties
+
+
+@instrument.Action('saveLightFile')
+def saveLightFile(lightFile=None, lights=None):
+    # Set saved file name
+    if not lightFile:
+        lightFile = os.path.join(getLightDirectory(), 'lightFile_%s.json' % time.strftime('%m%d'))
+
+    properties = getLightProperties(lights)
+
+    # Save as json
+    with instrument.Phase('json'):
+        with open(lightFile, 'w') as f:
+            json.dump(properties, f, indent=4)
+
+    logger.info('Saving file to %s' % lightFile)
+    return lightFile
+
+
+@instrument.Action('importLightFile')
+def importLightFile(lightFile):
+    # Read json data
+    with instrument.Phase('json'):
+        with open(lightFile, 'r') as f:
+            properties = json.load(f)
+
+    lights = []
+
+    # Generate light based on json file
+    for light, info in properties.items():
+        # Get light type
+        lightType = info.get('lightType')
+        for lt in LIGHT_TYPES:
+            if ('%sLight' % lt.split()[0].lower()) == lightType:
+                break
+        else:
+            logger.info('Cannot find a corresponding light type for %s (%s)' % (light, lightType))
+            continue
+
+        # create the light
+        light = LIGHT_TYPES[lt]()
+
+        # Set json data into attr
+        light.intensity.set(info.get('intensity'))
+
+        light.color.set(info.get('color'))
+
+        transform = light.getTransform()
+        transform.translate.set(info.get('translate'))
+        transform.rotate.set(info.get('rotate'))
+
+        lights.append(light)
+
+    return lights
+
+
 class LightManager(QtWidgets.QWidget):
-    lightTypes = {
-        "Point Light": pm.pointLight,
-        "Spot Light": pm.spotLight,
-        "Direction Light": pm.directionalLight,
-        "Area Light": partial(pm.shadingNode, 'areaLight', asLight=True),
-        "Volume Light": partial(pm.shadingNode, 'volumeLight', asLight=True),
-    }
+    lightTypes = LIGHT_TYPES
 
     def __init__(self, dock=True):
         # parent = getMayaMainWindow()
@@ -75,16 +175,20 @@ class LightManager(QtWidgets.QWidget):
             parent.show()
 
     def populate(self):
-        while self.scrollLayout.count():
+        with instrument.Action('LightManager.populate') as action:
+            while self.scrollLayout.count():
 
-            widget = self.scrollLayout.takeAt(0).widget()
-            if widget:
-                widget.setVisible(False)
-                widget.deleteLater()
+                widget = self.scrollLayout.takeAt(0).widget()
+                if widget:
+                    widget.setVisible(False)
+                    widget.deleteLater()
 
-        # Loop all light element in sense
-        for light in pm.ls(type=["areaLight", "spotLight", "pointLight", "directionalLight", "volumeLight"]):
-            self.addLight(light)
+            # Loop all light element in sense
+            lights = pm.ls(type=LIGHT_SHAPES)
+            for light in lights:
+                self.addLight(light)
+
+            action.set('lights', len(lights))
 
     def buildUI(self):
         layout = QtWidgets.QGridLayout(self)
@@ -121,81 +225,31 @@ class LightManager(QtWidgets.QWidget):
         refreshBtn.clicked.connect(self.populate)
         layout.addWidget(refreshBtn, 2, 2)
 
+    @instrument.Action('LightManager.saveLights')
     def saveLights(self):
         # save data sa json
-
-        properties = {}
-
-        for lightWidget in self.findChildren(LightWidget):
-            # Get light transform attr
-            light = lightWidget.light
-            transform = light.getTransform()
-
-            # Save data in properties
-            properties[str(transform)] = {
-                'translate': list(transform.translate.get()),
-                'rotate': list(transform.rotate.get()),
-                'lightType': pm.objectType(light),
-                'intensity': light.intensity.get(),
-                'color': light.color.get()
-            }
-
-        # Set saved file path
-        directory = self.getDirectory()
-
-        # Set saved file name
-        lightFile = os.path.join(directory, 'lightFile_%s.json' % time.strftime('%m%d'))
-
-        # Save as json
-        with open(lightFile, 'w') as f:
-            json.dump(properties, f, indent=4)
-
-        logger.info('Saving file to %s' % lightFile)
+        lights = [lightWidget.light for lightWidget in self.findChildren(LightWidget)]
+        saveLightFile(lights=lights)
 
     def getDirectory(self):
-        # Get saved file path
-        directory = os.path.join(pm.internalVar(userAppDir=True), 'lightManager')
-        if not os.path.exists(directory):
-            os.mkdir(directory)
-        return directory
+        return getLightDirectory()
 
     def importLights(self):
-        # Read json file
-
         # Get saved file path
         directory = self.getDirectory()
         # Open a new window to locate json file
         fileName = QtWidgets.QFileDialog.getOpenFileName(self, "light Browser", directory)
 
-        # Read json data
-        with open(fileName[0], 'r') as f:
-            properties = json.load(f)
-
-        # Generate light based on json file
-        for light, info in properties.items():
-            # Get light type
-            lightType = info.get('lightType')
-            for lt in self.lightTypes:
-                if ('%sLight' % lt.split()[0].lower()) == lightType:
-                    break
-            else:
-                logger.info('Cannot find a corresponding light type for %s (%s)' % (light, lightType))
-                continue
-
-            # create the light
-            light = self.createLight(lightType=lt)
+        # Cancelled
+        if not fileName[0]:
+            return
 
-            # Set json data into attr
-            light.intensity.set(info.get('intensity'))
+        # Time the import only, not the artist browsing for the file
+        with instrument.Action('LightManager.importLights', lightFile=fileName[0]):
+            importLightFile(fileName[0])
 
-            light.color.set(info.get('color'))
-
-            transform = light.getTransform()
-            transform.translate.set(info.get('translate'))
-            transform.rotate.set(info.get('rotate'))
-
-        # Refresh
-        self.populate()
+            # Refresh
+            self.populate()
 
     def createLight(self, lightType=None, add=True):
         # Create light
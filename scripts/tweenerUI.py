@@ -1,7 +1,12 @@
 #coding:utf-8
 from maya import cmds
 
+import instrument
 
+cmds = instrument.commands(cmds)
+
+
+@instrument.Action('tween')
 def tween(percentage, obj=None, attrs=None, selection=True):
 
     if not obj and not selection:
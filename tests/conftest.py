@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks', 'fakeMaya'))
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+
+from maya import cmds
+
+import instrument
+
+
+@pytest.fixture(autouse=True)
+def scene():
+    cmds.resetScene()
+    cmds.resetCallCounts()
+    yield cmds.scene
+    instrument.disable()
+    instrument.records.clear()
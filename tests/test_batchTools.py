@@ -0,0 +1,106 @@
+import os
+import json
+import time
+
+import pytest
+from maya import cmds
+
+import batchTools
+
+
+@pytest.fixture(autouse=True)
+def poll(monkeypatch):
+    # Keep the parent loop quick, the tests use timeouts of a second or two
+    monkeypatch.setattr(batchTools, 'POLL', 0.05)
+
+
+def makeScenes(directory, names, lights=2):
+    scenes = []
+    for name in names:
+        cmds.resetScene()
+        for _ in range(lights):
+            cmds.pointLight()
+
+        path = os.path.join(str(directory), '%s.ma' % name)
+        cmds.file(rename=path)
+        cmds.file(save=True, force=True)
+        scenes.append(path)
+
+    cmds.resetScene()
+    return scenes
+
+
+def hangOn(monkeypatch, sceneName):
+    exportLightRig = batchTools.OPERATIONS['export-lights']
+
+    def operation(path, **kwargs):
+        if os.path.basename(path) == sceneName:
+            time.sleep(60)
+        return exportLightRig(path, **kwargs)
+
+    # Workers are forked, they see the patched operation
+    monkeypatch.setitem(batchTools.OPERATIONS, 'export-lights', operation)
+
+
+def test_export_lights(tmp_path):
+    scenes = makeScenes(tmp_path, ['shotA', 'shotB'], lights=3)
+    output = tmp_path / 'rigs'
+    report = str(tmp_path / 'report.json')
+
+    code = batchTools.main(['export-lights', str(tmp_path), '--output', str(output), '--jobs', '2',
+                            '--report', report])
+
+    assert code == 0
+    with open(report) as f:
+        results = json.load(f)
+    assert sorted(r['scene'] for r in results) == scenes
+    assert not any(r['error'] for r in results)
+
+    with open(str(output / 'shotA.json')) as f:
+        assert len(json.load(f)) == 3
+
+
+def test_duplicate_light_file_names_are_refused(tmp_path, caplog):
+    (tmp_path / 'first').mkdir()
+    (tmp_path / 'second').mkdir()
+    first = makeScenes(tmp_path / 'first', ['shot'])
+    second = makeScenes(tmp_path / 'second', ['shot'])
+    output = tmp_path / 'rigs'
+
+    code = batchTools.main(['export-lights', first[0], second[0], '--output', str(output)])
+
+    assert code == 1
+    assert 'Scenes would write the same light file' in caplog.text
+    assert not os.listdir(str(output))
+
+
+def test_initialize_failure_aborts_batch(tmp_path, monkeypatch):
+    import maya.standalone
+
+    def initialize(name='python'):
+        raise RuntimeError('No licence')
+
+    monkeypatch.setattr(maya.standalone, 'initialize', initialize)
+    scenes = makeScenes(tmp_path, ['a', 'b', 'c'])
+
+    start = time.time()
+    results = batchTools.runBatch('export-lights', scenes, jobs=2, output=str(tmp_path))
+
+    assert results == []
+    assert time.time() - start < 10
+
+
+@pytest.mark.parametrize('isolate', [False, True])
+def test_timeout_only_fails_hung_scene(tmp_path, monkeypatch, isolate):
+    hangOn(monkeypatch, 'a.ma')
+    scenes = makeScenes(tmp_path, ['a', 'b', 'c'])
+
+    start = time.time()
+    results = batchTools.runBatch('export-lights', scenes, jobs=1, timeout=1, isolate=isolate,
+                                  output=str(tmp_path))
+
+    errors = dict((os.path.basename(r['scene']), r['error']) for r in results)
+    assert 'Timed out' in errors.pop('a.ma')
+    # The scenes queued behind the hung one run on a new worker
+    assert errors == {'b.ma': None, 'c.ma': None}
+    assert time.time() - start < 10
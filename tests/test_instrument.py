@@ -0,0 +1,119 @@
+import os
+import sys
+import types
+
+import pytest
+from maya import cmds
+
+import instrument
+import lightingManager
+
+
+def lastRecord():
+    return instrument.records[-1]
+
+
+def test_disabled_records_nothing():
+    with instrument.Action('idle') as action:
+        cmds.ls()
+
+    assert action.record is None
+    assert not instrument.records
+
+
+def test_nested_actions_merge_into_parent():
+    instrument.enable()
+
+    with instrument.Action('parent'):
+        cmds.ls()
+        with instrument.Action('child'):
+            cmds.ls()
+            cmds.objectType('defaultRenderGlobals')
+            with instrument.Phase('json'):
+                pass
+
+    record = lastRecord()
+    assert record['name'] == 'parent'
+    assert record['commandCount'] == 3
+    assert record['commands']['ls']['count'] == 2
+    assert record['phases']['json']['count'] == 1
+    assert [child['name'] for child in record['children']] == ['child']
+    assert record['children'][0]['commandCount'] == 2
+
+
+def test_command_issued_by_command_counts_once(monkeypatch):
+    pmcmds = types.ModuleType('pymel.internal.pmcmds')
+    pmcmds.ls = lambda *args, **kwargs: cmds.ls(*args, **kwargs)
+    monkeypatch.setitem(sys.modules, 'pymel.internal.pmcmds', pmcmds)
+    instrument.enable()
+
+    with instrument.Action('outer'):
+        pmcmds.ls()
+
+    # Counted as pmcmds.ls, the maya.cmds.ls underneath is not counted again
+    assert list(lastRecord()['commands']) == ['ls']
+    assert lastRecord()['commandCount'] == 1
+
+
+def test_disable_restores_original_functions():
+    original = cmds.getAttr
+    instrument.enable()
+    assert cmds.getAttr is not original
+
+    instrument.disable()
+    assert cmds.getAttr is original
+
+
+def test_callable_objects_are_left_alone(monkeypatch):
+
+    class OptionVarDict(dict):
+        def __call__(self, *args):
+            pass
+
+    monkeypatch.setattr(cmds, 'optionVar', OptionVarDict(a=1), raising=False)
+    instrument.enable()
+
+    assert cmds.optionVar['a'] == 1
+
+
+@pytest.mark.parametrize('lights', [1, 10])
+def test_light_counts_match_fake(tmp_path, lights):
+    for _ in range(lights):
+        cmds.pointLight()
+    instrument.enable()
+    lightFile = str(tmp_path / 'lights.json')
+
+    cmds.resetCallCounts()
+    lightingManager.saveLightFile(lightFile)
+    assert lastRecord()['commandCount'] == sum(cmds.callCounts.values()) == 6 * lights + 1
+
+    cmds.resetScene()
+    cmds.resetCallCounts()
+    lightingManager.importLightFile(lightFile)
+    assert lastRecord()['commandCount'] == sum(cmds.callCounts.values()) == 6 * lights
+
+
+def test_cancelled_import_is_not_recorded(monkeypatch):
+    manager = lightingManager.LightManager()
+    instrument.enable()
+    monkeypatch.setattr(lightingManager.QtWidgets.QFileDialog, 'getOpenFileName',
+                        staticmethod(lambda *args: ('', '')))
+
+    manager.importLights()
+
+    assert not instrument.records
+
+
+def test_trace_only_kept_with_trace_file(tmp_path):
+    instrument.enable()
+    with instrument.Action('untraced'):
+        pass
+    assert not instrument._traceEvents
+
+    traceFile = str(tmp_path / 'trace.json')
+    instrument.enable(traceFile=traceFile)
+    with instrument.Action('traced'):
+        pass
+    assert [event['name'] for event in instrument._traceEvents] == ['traced']
+    assert instrument._traceEvents.maxlen
+    assert instrument.writeTrace(perProcess=True).endswith('trace_%s.json' % os.getpid())